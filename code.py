@@ -1,542 +1,739 @@
-"""
-DOCX → JSON (via Docling) → Editable HTML + Reconstructed DOCX.
-"""
-import json
-from pathlib import Path
-from docling.document_converter import DocumentConverter, InputFormat, WordFormatOption
-from docling.datamodel.pipeline_options import PaginatedPipelineOptions
-
-def docx_to_json_to_html(input_docx_path, output_json_path=None, output_html_path=None):
-    """
-    Convert DOCX to JSON first, then JSON to HTML
-    
-    Args:
-        input_docx_path: Path to input DOCX file
-        output_json_path: Path for JSON output (optional)
-        output_html_path: Path for HTML output (optional)
-    """
-    
-    # Setup paths
-    input_path = Path(input_docx_path)
-    
-    if output_json_path is None:
-        output_json_path = input_path.with_suffix('.json')
-    else:
-        output_json_path = Path(output_json_path)
-        
-    if output_html_path is None:
-        output_html_path = input_path.with_name(f"{input_path.stem}-editable.html")
-    else:
-        output_html_path = Path(output_html_path)
-    
-    # Configure pipeline options
-    docx_pipeline = PaginatedPipelineOptions()
-    docx_pipeline.generate_page_images = False
-    
-    # Setup document converter
-    converter = DocumentConverter(
-        allowed_formats=[InputFormat.DOCX],
-        format_options={InputFormat.DOCX: WordFormatOption(pipeline_options=docx_pipeline)},
-    )
-    
-    # Step 1: Convert DOCX to JSON
-    print(f"Converting {input_path} to JSON...")
-    result = converter.convert(str(input_path))
-    doc = result.document
-    
-    # Export to JSON
-    json_content = doc.export_to_dict()  # Gets the document as a dictionary
-    
-    # Save JSON file
-    with open(output_json_path, 'w', encoding='utf-8') as f:
-        json.dump(json_content, f, indent=2, ensure_ascii=False)
-    print(f"JSON saved: {output_json_path.resolve()}")
-    
-    # Step 2: Convert JSON to HTML
-    print("Converting JSON to HTML...")
-    html_content = json_to_html(json_content)
-    
-    # Create complete HTML shell
-    html_shell = create_html_shell(html_content, input_path.stem)
-    
-    # Save HTML file
-    output_html_path.write_text(html_shell, encoding="utf-8")
-    print(f"HTML saved: {output_html_path.resolve()}")
-    
-    return output_json_path, output_html_path
-
-def resolve_reference(ref_string, json_content):
-    """
-    Resolve a JSON reference like '#/texts/0' to the actual object
-    
-    Args:
-        ref_string: Reference string like '#/texts/0'
-        json_content: Full JSON document
-    
-    Returns:
-        dict: Referenced object
-    """
-    # Remove the '#/' prefix and split the path
-    path = ref_string.replace('#/', '').split('/')
-    
-    # Navigate through the JSON structure
-    current = json_content
-    for part in path:
-        if part.isdigit():
-            current = current[int(part)]
-        else:
-            current = current[part]
-    
-    return current
-
-def json_to_html(json_content):
-    """
-    Convert Docling JSON document structure to HTML
-    
-    Args:
-        json_content: Dictionary containing Docling document structure
-    
-    Returns:
-        str: HTML content
-    """
-    print("Processing Docling JSON structure...")
-    
-    html_parts = []
-    
-    # Process the body content in order
-    if 'body' in json_content and 'children' in json_content['body']:
-        children = json_content['body']['children']
-        print(f"Found {len(children)} body children")
-        
-        for child in children:
-            if '$ref' in child:
-                ref = child['$ref']
-                
-                # Resolve the reference to get the actual content
-                try:
-                    content_item = resolve_reference(ref, json_content)
-                    
-                    if ref.startswith('#/texts/'):
-                        html_parts.append(process_text_item(content_item))
-                    elif ref.startswith('#/tables/'):
-                        html_parts.append(process_table_item(content_item))
-                    elif ref.startswith('#/pictures/'):
-                        html_parts.append(process_picture_item(content_item))
-                    
-                except (KeyError, IndexError) as e:
-                    print(f"Warning: Could not resolve reference {ref}: {e}")
-                    continue
-    
-    # Filter out empty strings and join
-    return '\n'.join(filter(None, html_parts))
-
-def process_text_item(text_item):
-    """
-    Process a text item from the Docling JSON structure
-    
-    Args:
-        text_item: Text item dictionary
-    
-    Returns:
-        str: HTML representation
-    """
-    text = text_item.get('text', '').strip()
-    
-    # Skip empty text items
-    if not text:
-        return ''
-    
-    # Get formatting information
-    formatting = text_item.get('formatting', {})
-    label = text_item.get('label', 'paragraph')
-    
-    # Apply formatting
-    if formatting.get('bold'):
-        if len(text) > 50:  # Long bold text is likely a heading
-            html_tag = 'h2'
-        else:
-            html_tag = 'strong'
-            text = f'<{html_tag}>{escape_html(text)}</{html_tag}>'
-            return f'<p>{text}</p>'
-    else:
-        html_tag = 'p'
-    
-    # Apply other formatting
-    if formatting.get('italic'):
-        text = f'<em>{escape_html(text)}</em>'
-    elif formatting.get('underline'):
-        text = f'<u>{escape_html(text)}</u>'
-    elif formatting.get('strikethrough'):
-        text = f'<del>{escape_html(text)}</del>'
-    else:
-        text = escape_html(text)
-    
-    # Determine the HTML element based on label and formatting
-    if html_tag == 'h2':
-        return f'<h2>{text}</h2>'
-    elif label == 'title':
-        return f'<h1>{text}</h1>'
-    elif label == 'heading':
-        return f'<h3>{text}</h3>'
-    else:
-        return f'<p>{text}</p>'
-
-def process_table_item(table_item):
-    """
-    Process a table item from the Docling JSON structure
-    
-    Args:
-        table_item: Table item dictionary
-    
-    Returns:
-        str: HTML table representation
-    """
-    if 'data' not in table_item or 'grid' not in table_item['data']:
-        return ''
-    
-    grid = table_item['data']['grid']
-    if not grid:
-        return ''
-    
-    html_parts = ['<table>']
-    
-    for row_idx, row in enumerate(grid):
-        html_parts.append('  <tr>')
-        
-        for cell in row:
-            cell_text = cell.get('text', '').strip()
-            
-            # Determine if this is a header cell
-            is_header = cell.get('column_header', False) or cell.get('row_header', False)
-            tag = 'th' if is_header else 'td'
-            
-            # Handle cell spanning
-            row_span = cell.get('row_span', 1)
-            col_span = cell.get('col_span', 1)
-            
-            span_attrs = ''
-            if row_span > 1:
-                span_attrs += f' rowspan="{row_span}"'
-            if col_span > 1:
-                span_attrs += f' colspan="{col_span}"'
-            
-            html_parts.append(f'    <{tag}{span_attrs}>{escape_html(cell_text)}</{tag}>')
-        
-        html_parts.append('  </tr>')
-    
-    html_parts.append('</table>')
-    
-    return '\n'.join(html_parts)
-
-import base64
-
-def process_picture_item(picture_item):
-    """
-    Process a picture item from the Docling JSON structure
-    
-    Args:
-        picture_item: Picture item dictionary
-    
-    Returns:
-        str: HTML <img> tag with embedded base64 image
-    """
-    # If no data, return placeholder
-    if 'data' not in picture_item:
-        return '<div class="image-placeholder">[Missing Image]</div>'
-    
-    # Get image data
-    img_data = picture_item['data']
-    img_format = picture_item.get('format', 'png')  # default to PNG
-    
-    # Create base64 data URI
-    img_src = f"data:image/{img_format};base64,{img_data}"
-    
-    return f'<img src="{img_src}" alt="Embedded Image" style="max-width:100%; height:auto; margin:10px 0;" />'
-
-
-def escape_html(text):
-    """
-    Escape HTML special characters
-    
-    Args:
-        text: Input text
-    
-    Returns:
-        str: HTML-escaped text
-    """
-    if not isinstance(text, str):
-        text = str(text)
-    
-    return (text
-            .replace('&', '&amp;')
-            .replace('<', '&lt;')
-            .replace('>', '&gt;')
-            .replace('"', '&quot;')
-            .replace("'", '&#x27;'))
-
-def create_html_shell(content_html, document_title):
-    """
-    Create complete HTML document with embedded CSS
-    
-    Args:
-        content_html: Main content HTML
-        document_title: Document title for page title
-    
-    Returns:
-        str: Complete HTML document
-    """
-    return f"""<!doctype html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>Editable — {document_title}</title>
-    <style>
-        body {{ 
-            font-family: Arial, Helvetica, sans-serif; 
-            margin: 16px; 
-            line-height: 1.6;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        
-        /* Typography */
-        h1, h2, h3 {{ 
-            color: #333; 
-            margin: 1.5em 0 0.5em 0; 
-        }}
-        h1 {{ 
-            font-size: 1.8em; 
-            text-align: center;
-            border-bottom: 2px solid #333;
-            padding-bottom: 10px;
-        }}
-        h2 {{ 
-            font-size: 1.5em; 
-            color: #2c5aa0;
-        }}
-        h3 {{ font-size: 1.2em; }}
-        
-        p {{ 
-            margin: 0.5em 0; 
-        }}
-        
-        /* Bold text styling */
-        strong {{
-            font-weight: bold;
-            color: #2c5aa0;
-        }}
-        
-        /* Tables */
-        table {{ 
-            border-collapse: collapse; 
-            width: 100%; 
-            margin: 1.5em 0; 
-            border: 2px solid #333;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        th, td {{ 
-            border: 1px solid #ccc; 
-            padding: 12px 15px; 
-            vertical-align: top; 
-            text-align: left;
-        }}
-        th {{
-            background-color: #f8f9fa;
-            font-weight: bold;
-            color: #2c5aa0;
-            border-bottom: 2px solid #2c5aa0;
-        }}
-        
-        /* Alternating row colors */
-        tr:nth-child(even) {{
-            background-color: #f9f9f9;
-        }}
-        
-        /* Lists */
-        ul, ol {{ 
-            margin: 0.5em 0 0.5em 1.5em; 
-        }}
-        li {{
-            margin: 0.3em 0;
-        }}
-        
-        /* Image placeholders */
-        .image-placeholder {{
-            background: #f0f0f0;
-            border: 2px dashed #ccc;
-            padding: 20px;
-            text-align: center;
-            margin: 10px 0;
-            color: #666;
-        }}
-        
-        /* Editing features */
-        [contenteditable="true"]:focus {{ 
-            outline: 2px solid #4c9ffe; 
-            background-color: #fafafa;
-        }}
-        
-        /* Control panel */
-        .control-panel {{
-            position: sticky;
-            top: 0;
-            background: white;
-            border-bottom: 1px solid #ddd;
-            padding: 10px;
-            margin-bottom: 20px;
-            z-index: 100;
-        }}
-        
-        .control-button {{
-            background: #007bff;
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 4px;
-            cursor: pointer;
-            margin-right: 10px;
-            font-size: 14px;
-        }}
-        .control-button:hover {{
-            background: #0056b3;
-        }}
-        
-        .control-button.secondary {{
-            background: #6c757d;
-        }}
-        .control-button.secondary:hover {{
-            background: #545b62;
-        }}
-        
-        /* JSON display */
-        #json-display {{
-            display: none;
-            background: #f8f8f8;
-            border: 1px solid #ddd;
-            padding: 15px;
-            margin: 15px 0;
-            border-radius: 5px;
-            font-family: 'Courier New', monospace;
-            white-space: pre-wrap;
-            max-height: 400px;
-            overflow-y: auto;
-            font-size: 12px;
-        }}
-        
-        /* Status indicator */
-        .status {{
-            float: right;
-            padding: 5px 10px;
-            border-radius: 3px;
-            font-size: 12px;
-        }}
-        .status.saved {{
-            background: #d4edda;
-            color: #155724;
-        }}
-        .status.modified {{
-            background: #fff3cd;
-            color: #856404;
-        }}
-    </style>
-</head>
-<body>
-    <div class="control-panel">
-        <button class="control-button" onclick="toggleJsonDisplay()">Show/Hide JSON</button>
-        <button class="control-button secondary" onclick="exportContent()">Export HTML</button>
-        <button class="control-button secondary" onclick="printDocument()">Print</button>
-        <div class="status saved" id="status">Saved</div>
-    </div>
-    
-    <div id="json-display"></div>
-    
-    <div id="editor" contenteditable="true">
-        {content_html}
-    </div>
-    
-    <script>
-        let isJsonVisible = false;
-        let hasUnsavedChanges = false;
-        
-        function toggleJsonDisplay() {{
-            const jsonDiv = document.getElementById('json-display');
-            isJsonVisible = !isJsonVisible;
-            
-            if (isJsonVisible) {{
-                jsonDiv.style.display = 'block';
-                jsonDiv.textContent = 'JSON structure processed to create this editable document.\\n\\nOriginal structure: Docling format with references to text and table elements.';
-            }} else {{
-                jsonDiv.style.display = 'none';
-            }}
-        }}
-        
-        function exportContent() {{
-            const content = document.getElementById('editor').innerHTML;
-            const blob = new Blob([content], {{ type: 'text/html' }});
-            const url = URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = 'exported-content.html';
-            a.click();
-            URL.revokeObjectURL(url);
-        }}
-        
-        function printDocument() {{
-            window.print();
-        }}
-        
-        function updateStatus(status) {{
-            const statusDiv = document.getElementById('status');
-            statusDiv.className = 'status ' + status;
-            statusDiv.textContent = status === 'saved' ? 'Saved' : 'Modified';
-        }}
-        
-        // Auto-save functionality
-        let saveTimeout;
-        document.getElementById('editor').addEventListener('input', function() {{
-            hasUnsavedChanges = true;
-            updateStatus('modified');
-            
-            clearTimeout(saveTimeout);
-            saveTimeout = setTimeout(function() {{
-                // Simulate save
-                hasUnsavedChanges = false;
-                updateStatus('saved');
-                console.log('Auto-saved content');
-            }}, 2000);
-        }});
-        
-        // Warn before leaving if there are unsaved changes
-        window.addEventListener('beforeunload', function(e) {{
-            if (hasUnsavedChanges) {{
-                e.preventDefault();
-                e.returnValue = '';
-            }}
-        }});
-    </script>
-</body>
-</html>"""
-
-# Main execution
-if __name__ == "__main__":
-    # Configuration
-    input_docx = r"documents\Master Approval Ltr (1).docx"
-    output_json = "output\Master-Approval-Ltr-1.json"
-    output_html = "output\Master-Approval-Ltr-1-editable.html"
-    
-    # Run conversion
-    try:
-        json_path, html_path = docx_to_json_to_html(
-            input_docx_path=input_docx,
-            output_json_path=output_json,
-            output_html_path=output_html
-        )
-        print(f"\nConversion completed successfully!")
-        print(f"JSON: {json_path}")
-        print(f"HTML: {html_path}")
-        
-    except Exception as e:
-        print(f"Error during conversion: {e}")
-        import traceback
+"""
+DOCX → JSON (via Docling) → Editable HTML + Reconstructed DOCX.
+"""
+import functools
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from pathlib import Path
+import orjson
+from docling.document_converter import DocumentConverter, InputFormat, WordFormatOption
+from docling.datamodel.pipeline_options import AcceleratorOptions, PaginatedPipelineOptions
+
+@functools.lru_cache(maxsize=4)
+def _get_converter(generate_page_images=False, generate_picture_images=False,
+                   num_threads=None):
+    """Build (once) and cache the configured DocumentConverter; construction
+    carries heavy initialization, so server-style repeated calls reuse it.
+
+    The pipeline is told to skip everything this converter never consumes:
+    page and picture image generation stay off unless a caller asks, and
+    num_threads caps Docling's own threading (pass 1 under the process pool
+    so workers don't oversubscribe cores). The DOCX backend runs no OCR or
+    table-structure models, so there is nothing further to disable.
+    """
+    docx_pipeline = PaginatedPipelineOptions()
+    docx_pipeline.generate_page_images = generate_page_images
+    docx_pipeline.generate_picture_images = generate_picture_images
+    if num_threads is not None:
+        docx_pipeline.accelerator_options = AcceleratorOptions(num_threads=num_threads)
+
+    return DocumentConverter(
+        allowed_formats=[InputFormat.DOCX],
+        format_options={InputFormat.DOCX: WordFormatOption(pipeline_options=docx_pipeline)},
+    )
+
+def _export_document(doc):
+    """Export a Docling document as a plain dict plus its raw JSON bytes.
+
+    Dumping through pydantic's C-accelerated serializer and reparsing with
+    orjson is faster than export_to_dict's Python-level recursion, and the
+    raw bytes can go to disk unchanged. Falls back to export_to_dict (with
+    no raw bytes) when the model doesn't expose model_dump_json.
+
+    Returns:
+        tuple: (json_content dict, raw UTF-8 bytes or None)
+    """
+    try:
+        # Match export_to_dict's dump settings: by_alias keeps the '$ref'
+        # keys (the model field is 'cref') and exclude_none drops the null
+        # fields, so the raw bytes keep the baseline JSON schema
+        raw = doc.model_dump_json(by_alias=True, exclude_none=True)
+    except AttributeError:
+        return doc.export_to_dict(), None
+
+    return orjson.loads(raw), raw if isinstance(raw, bytes) else raw.encode('utf-8')
+
+def docx_to_json_to_html(input_docx_path, output_json_path=None, output_html_path=None,
+                         write_json=True, pretty=False):
+    """
+    Convert DOCX to JSON first, then JSON to HTML
+
+    Args:
+        input_docx_path: Path to input DOCX file
+        output_json_path: Path for JSON output (optional)
+        output_html_path: Path for HTML output (optional)
+        write_json: Whether to write the JSON artifact to disk; pass False
+            to skip the serialization entirely when only the HTML is needed
+        pretty: Indent the JSON artifact for debugging; compact output is
+            the default (roughly half the bytes, much faster to encode)
+    """
+    
+    # Setup paths
+    input_path = Path(input_docx_path)
+    
+    if output_json_path is None:
+        output_json_path = input_path.with_suffix('.json')
+    else:
+        output_json_path = Path(output_json_path)
+        
+    if output_html_path is None:
+        output_html_path = input_path.with_name(f"{input_path.stem}-editable.html")
+    else:
+        output_html_path = Path(output_html_path)
+    
+    # Setup document converter (cached across calls)
+    converter = _get_converter()
+
+    # Step 1: Convert DOCX to JSON
+    print(f"Converting {input_path} to JSON...")
+    result = converter.convert(str(input_path))
+    doc = result.document
+    
+    # Export to JSON
+    json_content, raw_json = _export_document(doc)
+
+    # Save JSON file; json_to_html consumes the in-memory dict, so the
+    # write is optional, and the serializer's raw bytes are reused when
+    # available instead of re-encoding the dict
+    if write_json:
+        if pretty:
+            output_json_path.write_bytes(
+                orjson.dumps(json_content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        elif raw_json is not None:
+            output_json_path.write_bytes(raw_json)
+        else:
+            output_json_path.write_bytes(
+                orjson.dumps(json_content, option=orjson.OPT_NON_STR_KEYS)
+            )
+        print(f"JSON saved: {output_json_path.resolve()}")
+    
+    # Step 2: Convert JSON to HTML
+    print("Converting JSON to HTML...")
+    html_content = json_to_html(json_content)
+
+    # Save HTML file: one encode of the dynamic body + binary write; the
+    # static shell around it was pre-encoded at import time (the output can
+    # be tens of MB with embedded base64 images)
+    output_html_path.write_bytes(_create_html_shell_bytes(html_content, input_path.stem))
+    print(f"HTML saved: {output_html_path.resolve()}")
+    
+    return output_json_path, output_html_path
+
+def docx_to_html(input_docx_path):
+    """
+    Convert DOCX straight to an editable HTML string, with no JSON or HTML
+    files written to disk
+
+    Args:
+        input_docx_path: Path to input DOCX file
+
+    Returns:
+        str: Complete HTML document
+    """
+    input_path = Path(input_docx_path)
+
+    converter = _get_converter()
+
+    result = converter.convert(str(input_path))
+    json_content, _ = _export_document(result.document)
+
+    return create_html_shell(json_to_html(json_content), input_path.stem)
+
+def _init_worker():
+    """Warm the per-process converter cache so each pool worker pays the
+    expensive construction once, before its first task. Each worker runs
+    Docling single-threaded; parallelism comes from the pool itself."""
+    _get_converter(num_threads=1)
+
+def _convert_one(input_docx_path):
+    """Convert a single DOCX using the worker's shared converter."""
+    input_path = Path(input_docx_path)
+    output_json_path = input_path.with_suffix('.json')
+    output_html_path = input_path.with_name(f"{input_path.stem}-editable.html")
+
+    result = _get_converter(num_threads=1).convert(str(input_path))
+    json_content, raw_json = _export_document(result.document)
+
+    if raw_json is not None:
+        output_json_path.write_bytes(raw_json)
+    else:
+        output_json_path.write_bytes(
+            orjson.dumps(json_content, option=orjson.OPT_NON_STR_KEYS)
+        )
+
+    output_html_path.write_bytes(
+        _create_html_shell_bytes(json_to_html(json_content), input_path.stem)
+    )
+
+    return output_json_path, output_html_path
+
+def convert_many(paths, workers=None):
+    """
+    Convert a batch of DOCX files in parallel
+
+    Args:
+        paths: Iterable of input DOCX paths
+        workers: Number of worker processes (default: half the CPU count)
+
+    Returns:
+        list: (json_path, html_path) tuples, in input order
+    """
+    paths = list(paths)
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 2) // 2)
+
+    # Chunk submissions so IPC overhead is amortized across several files
+    chunksize = max(1, len(paths) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return list(pool.map(_convert_one, paths, chunksize=chunksize))
+
+@functools.lru_cache(maxsize=None)
+def _parse_ref(ref_string):
+    """Parse a reference like '#/texts/0' into ('texts', 0), cached per
+    distinct ref string. Numeric segments are converted up front so the
+    resolution loop pays no isdigit/int cost per lookup."""
+    parts = ref_string.replace('#/', '').split('/')
+    return tuple(int(p) if p.isdigit() else p for p in parts)
+
+def resolve_reference(ref_string, json_content):
+    """
+    Resolve a JSON reference like '#/texts/0' to the actual object
+
+    Args:
+        ref_string: Reference string like '#/texts/0'
+        json_content: Full JSON document
+
+    Returns:
+        dict: Referenced object
+    """
+    # Navigate through the JSON structure; int vs str dispatch happens
+    # inside __getitem__, so the loop itself is branch-free
+    current = json_content
+    for part in _parse_ref(ref_string):
+        current = current[part]
+
+    return current
+
+def json_to_html(json_content):
+    """
+    Convert Docling JSON document structure to HTML
+    
+    Args:
+        json_content: Dictionary containing Docling document structure
+    
+    Returns:
+        str: HTML content
+    """
+    print("Processing Docling JSON structure...")
+
+    # All processors write into one growing buffer instead of returning
+    # strings that get joined at the end: one amortized O(N) allocation
+    # rather than a temporary str per HTML fragment
+    out = StringIO()
+
+    # Process the body content in order
+    if 'body' in json_content and 'children' in json_content['body']:
+        children = json_content['body']['children']
+        print(f"Found {len(children)} body children")
+
+        for child in children:
+            if '$ref' in child:
+                ref = child['$ref']
+
+                # Split the ref once ('#/texts/0' -> kind, index), dispatch
+                # through the processor table, and index the collection
+                # directly instead of re-walking the path per prefix check
+                try:
+                    _, kind, idx = ref.split('/', 2)
+                    processor = _PROCESSORS.get(kind)
+                    if processor is None:
+                        continue
+
+                    content_item = json_content[kind][int(idx)]
+                    processor(content_item, out)
+
+                except (KeyError, IndexError, ValueError) as e:
+                    print(f"Warning: Could not resolve reference {ref}: {e}")
+                    continue
+
+    return out.getvalue()
+
+# Labels that map to a dedicated heading tag; everything else is a paragraph
+_LABEL_TO_TAG = {
+    'title': 'h1',
+    'heading': 'h3',
+}
+
+def process_text_item(text_item, out):
+    """
+    Process a text item from the Docling JSON structure
+
+    Args:
+        text_item: Text item dictionary
+        out: StringIO buffer the HTML is written into
+    """
+    text = text_item.get('text', '').strip()
+
+    # Skip empty text items
+    if not text:
+        return
+
+    # Unpack formatting once instead of one .get per branch
+    formatting = text_item.get('formatting') or {}
+    bold = formatting.get('bold')
+
+    # Long bold text is likely a heading; otherwise the label decides the tag
+    if bold and len(text) > 50:
+        tag = 'h2'
+    else:
+        tag = _LABEL_TO_TAG.get(text_item.get('label'), 'p')
+
+    # Apply inline formatting compositionally (bold + italic etc. combine
+    # instead of the first match winning)
+    text = escape_html(text)
+    if formatting.get('strikethrough'):
+        text = f'<del>{text}</del>'
+    if formatting.get('underline'):
+        text = f'<u>{text}</u>'
+    if formatting.get('italic'):
+        text = f'<em>{text}</em>'
+    if bold and tag == 'p':
+        text = f'<strong>{text}</strong>'
+
+    out.write(f'<{tag}>')
+    out.write(text)
+    out.write(f'</{tag}>')
+
+# Precomputed cell delimiters so the no-span fast path writes constants
+# instead of building an f-string per cell
+_TD_OPEN, _TD_CLOSE = '<td>', '</td>'
+_TH_OPEN, _TH_CLOSE = '<th>', '</th>'
+
+def process_table_item(table_item, out):
+    """
+    Process a table item from the Docling JSON structure
+
+    Args:
+        table_item: Table item dictionary
+        out: StringIO buffer the HTML is written into
+    """
+    if 'data' not in table_item or 'grid' not in table_item['data']:
+        return
+
+    grid = table_item['data']['grid']
+    if not grid:
+        return
+
+    out.write('<table>')
+
+    for row in grid:
+        out.write('<tr>')
+
+        for cell in row:
+            # Bind everything the cell needs up front: one .get per field
+            cell_text = escape_html(cell.get('text', '').strip())
+            is_header = cell.get('column_header') or cell.get('row_header')
+            row_span = cell.get('row_span', 1)
+            col_span = cell.get('col_span', 1)
+
+            # Fast path: the vast majority of cells span a single row/column
+            if row_span == 1 and col_span == 1:
+                if is_header:
+                    out.write(_TH_OPEN)
+                    out.write(cell_text)
+                    out.write(_TH_CLOSE)
+                else:
+                    out.write(_TD_OPEN)
+                    out.write(cell_text)
+                    out.write(_TD_CLOSE)
+            else:
+                tag = 'th' if is_header else 'td'
+                span_attrs = ''
+                if row_span > 1:
+                    span_attrs += f' rowspan="{row_span}"'
+                if col_span > 1:
+                    span_attrs += f' colspan="{col_span}"'
+                out.write(f'<{tag}{span_attrs}>{cell_text}</{tag}>')
+
+        out.write('</tr>')
+
+    out.write('</table>')
+
+import base64
+
+def process_picture_item(picture_item, out):
+    """
+    Process a picture item from the Docling JSON structure
+
+    Args:
+        picture_item: Picture item dictionary
+        out: StringIO buffer the HTML <img> tag is written into
+    """
+    # If no data, emit a placeholder
+    if 'data' not in picture_item:
+        out.write('<div class="image-placeholder">[Missing Image]</div>')
+        return
+
+    # Get image data
+    img_data = picture_item['data']
+    if isinstance(img_data, bytes):
+        # Encode once and cache on the item so repeated refs don't re-encode
+        img_data = base64.b64encode(img_data).decode('ascii')
+        picture_item['data'] = img_data
+    img_format = picture_item.get('format', 'png')  # default to PNG
+
+    # Write the data URI piecewise: the base64 payload (often MBs) goes
+    # straight into the buffer without an intermediate f-string copy
+    out.write('<img src="data:image/')
+    out.write(img_format)
+    out.write(';base64,')
+    out.write(img_data)
+    out.write('" alt="Embedded Image" style="max-width:100%; height:auto; margin:10px 0;" />')
+
+# Dispatch table mapping Docling collection names to their item processors
+_PROCESSORS = {
+    'texts': process_text_item,
+    'tables': process_table_item,
+    'pictures': process_picture_item,
+}
+
+# HTML escaping: markupsafe's C extension does the optimistic scan and
+# single-allocation substitution for us when it's installed; otherwise a
+# precompiled character class guards the fast path and a str.translate
+# table does the substitution in one C-level pass.
+try:
+    from markupsafe import escape as _markupsafe_escape
+except ImportError:
+    _markupsafe_escape = None
+
+_ESCAPE = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+}
+_ESCAPE_RE = re.compile(r"[&<>\"']")
+_ESCAPE_TT = str.maketrans(_ESCAPE)
+
+def escape_html(text):
+    """
+    Escape HTML special characters
+
+    Args:
+        text: Input text
+
+    Returns:
+        str: HTML-escaped text
+    """
+    if not isinstance(text, str):
+        text = str(text)
+
+    if not text:
+        return ''
+
+    if _markupsafe_escape is not None:
+        return str(_markupsafe_escape(text))
+
+    # Fast path: most text nodes contain none of the special characters, so a
+    # single C-level scan lets us hand back the original string untouched.
+    if _ESCAPE_RE.search(text) is None:
+        return text
+
+    return text.translate(_ESCAPE_TT)
+
+# The shell is static apart from two insertion points (title and body), so
+# the big CSS/JS blocks are built once at import time as plain constants
+# instead of being re-interpolated through a ~6 KB f-string on every call.
+_HTML_PROLOGUE = """<!doctype html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Editable — """
+
+_HTML_MID = """</title>
+    <style>
+        body { 
+            font-family: Arial, Helvetica, sans-serif; 
+            margin: 16px; 
+            line-height: 1.6;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        
+        /* Typography */
+        h1, h2, h3 { 
+            color: #333; 
+            margin: 1.5em 0 0.5em 0; 
+        }
+        h1 { 
+            font-size: 1.8em; 
+            text-align: center;
+            border-bottom: 2px solid #333;
+            padding-bottom: 10px;
+        }
+        h2 { 
+            font-size: 1.5em; 
+            color: #2c5aa0;
+        }
+        h3 { font-size: 1.2em; }
+        
+        p { 
+            margin: 0.5em 0; 
+        }
+        
+        /* Bold text styling */
+        strong {
+            font-weight: bold;
+            color: #2c5aa0;
+        }
+        
+        /* Tables */
+        table { 
+            border-collapse: collapse; 
+            width: 100%; 
+            margin: 1.5em 0; 
+            border: 2px solid #333;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        th, td { 
+            border: 1px solid #ccc; 
+            padding: 12px 15px; 
+            vertical-align: top; 
+            text-align: left;
+        }
+        th {
+            background-color: #f8f9fa;
+            font-weight: bold;
+            color: #2c5aa0;
+            border-bottom: 2px solid #2c5aa0;
+        }
+        
+        /* Alternating row colors */
+        tr:nth-child(even) {
+            background-color: #f9f9f9;
+        }
+        
+        /* Lists */
+        ul, ol { 
+            margin: 0.5em 0 0.5em 1.5em; 
+        }
+        li {
+            margin: 0.3em 0;
+        }
+        
+        /* Image placeholders */
+        .image-placeholder {
+            background: #f0f0f0;
+            border: 2px dashed #ccc;
+            padding: 20px;
+            text-align: center;
+            margin: 10px 0;
+            color: #666;
+        }
+        
+        /* Editing features */
+        [contenteditable="true"]:focus { 
+            outline: 2px solid #4c9ffe; 
+            background-color: #fafafa;
+        }
+        
+        /* Control panel */
+        .control-panel {
+            position: sticky;
+            top: 0;
+            background: white;
+            border-bottom: 1px solid #ddd;
+            padding: 10px;
+            margin-bottom: 20px;
+            z-index: 100;
+        }
+        
+        .control-button {
+            background: #007bff;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            cursor: pointer;
+            margin-right: 10px;
+            font-size: 14px;
+        }
+        .control-button:hover {
+            background: #0056b3;
+        }
+        
+        .control-button.secondary {
+            background: #6c757d;
+        }
+        .control-button.secondary:hover {
+            background: #545b62;
+        }
+        
+        /* JSON display */
+        #json-display {
+            display: none;
+            background: #f8f8f8;
+            border: 1px solid #ddd;
+            padding: 15px;
+            margin: 15px 0;
+            border-radius: 5px;
+            font-family: 'Courier New', monospace;
+            white-space: pre-wrap;
+            max-height: 400px;
+            overflow-y: auto;
+            font-size: 12px;
+        }
+        
+        /* Status indicator */
+        .status {
+            float: right;
+            padding: 5px 10px;
+            border-radius: 3px;
+            font-size: 12px;
+        }
+        .status.saved {
+            background: #d4edda;
+            color: #155724;
+        }
+        .status.modified {
+            background: #fff3cd;
+            color: #856404;
+        }
+    </style>
+</head>
+<body>
+    <div class="control-panel">
+        <button class="control-button" onclick="toggleJsonDisplay()">Show/Hide JSON</button>
+        <button class="control-button secondary" onclick="exportContent()">Export HTML</button>
+        <button class="control-button secondary" onclick="printDocument()">Print</button>
+        <div class="status saved" id="status">Saved</div>
+    </div>
+    
+    <div id="json-display"></div>
+    
+    <div id="editor" contenteditable="true">
+        """
+
+_HTML_EPILOGUE = """
+    </div>
+    
+    <script>
+        let isJsonVisible = false;
+        let hasUnsavedChanges = false;
+        
+        function toggleJsonDisplay() {
+            const jsonDiv = document.getElementById('json-display');
+            isJsonVisible = !isJsonVisible;
+            
+            if (isJsonVisible) {
+                jsonDiv.style.display = 'block';
+                jsonDiv.textContent = 'JSON structure processed to create this editable document.\\n\\nOriginal structure: Docling format with references to text and table elements.';
+            } else {
+                jsonDiv.style.display = 'none';
+            }
+        }
+        
+        function exportContent() {
+            const content = document.getElementById('editor').innerHTML;
+            const blob = new Blob([content], { type: 'text/html' });
+            const url = URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = 'exported-content.html';
+            a.click();
+            URL.revokeObjectURL(url);
+        }
+        
+        function printDocument() {
+            window.print();
+        }
+        
+        function updateStatus(status) {
+            const statusDiv = document.getElementById('status');
+            statusDiv.className = 'status ' + status;
+            statusDiv.textContent = status === 'saved' ? 'Saved' : 'Modified';
+        }
+        
+        // Auto-save functionality
+        let saveTimeout;
+        document.getElementById('editor').addEventListener('input', function() {
+            hasUnsavedChanges = true;
+            updateStatus('modified');
+            
+            clearTimeout(saveTimeout);
+            saveTimeout = setTimeout(function() {
+                // Simulate save
+                hasUnsavedChanges = false;
+                updateStatus('saved');
+                console.log('Auto-saved content');
+            }, 2000);
+        });
+        
+        // Warn before leaving if there are unsaved changes
+        window.addEventListener('beforeunload', function(e) {
+            if (hasUnsavedChanges) {
+                e.preventDefault();
+                e.returnValue = '';
+            }
+        });
+    </script>
+</body>
+</html>"""
+
+# Pre-encoded twins: file writes splice these in without re-encoding the
+# static majority of the document
+_HTML_PROLOGUE_B = _HTML_PROLOGUE.encode('utf-8')
+_HTML_MID_B = _HTML_MID.encode('utf-8')
+_HTML_EPILOGUE_B = _HTML_EPILOGUE.encode('utf-8')
+
+def create_html_shell(content_html, document_title):
+    """
+    Create complete HTML document with embedded CSS
+
+    Args:
+        content_html: Main content HTML
+        document_title: Document title for page title
+
+    Returns:
+        str: Complete HTML document
+    """
+    return ''.join((_HTML_PROLOGUE, document_title, _HTML_MID, content_html, _HTML_EPILOGUE))
+
+def _create_html_shell_bytes(content_html, document_title):
+    """Shell as UTF-8 bytes; only the title and body are encoded per call."""
+    return b''.join((
+        _HTML_PROLOGUE_B,
+        document_title.encode('utf-8'),
+        _HTML_MID_B,
+        content_html.encode('utf-8'),
+        _HTML_EPILOGUE_B,
+    ))
+
+# Main execution
+if __name__ == "__main__":
+    # Configuration
+    input_docx = r"documents\Master Approval Ltr (1).docx"
+    output_json = "output\Master-Approval-Ltr-1.json"
+    output_html = "output\Master-Approval-Ltr-1-editable.html"
+    
+    # Run conversion
+    try:
+        json_path, html_path = docx_to_json_to_html(
+            input_docx_path=input_docx,
+            output_json_path=output_json,
+            output_html_path=output_html
+        )
+        print(f"\nConversion completed successfully!")
+        print(f"JSON: {json_path}")
+        print(f"HTML: {html_path}")
+        
+    except Exception as e:
+        print(f"Error during conversion: {e}")
+        import traceback
         traceback.print_exc()
\ No newline at end of file